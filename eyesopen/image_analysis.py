@@ -2,11 +2,13 @@ import cv2
 import numpy as np
 import pywt
 import logging
-from typing import List
+import numba
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from numba import njit, prange
 
-from scipy.fftpack import fftshift, fft2
+from scipy.fft import fftshift, rfft2
 from skimage.feature import local_binary_pattern
-from skimage.filters import gabor
 from eyesopen.utilities import normalize_gray_image
 
 # Initialize logging
@@ -14,11 +16,283 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Worker threads for the FFT; -1 uses every core.
+_fft_workers = -1
+
+# Cleared by disable_cuda() to keep a process off the GPU.
+_cuda_allowed = True
+
+# Largest kernel side accepted by cv2.cuda.createLinearFilter.
+_CUDA_MAX_KERNEL_SIZE = 32
+
+
+def set_num_threads(num_threads: int) -> None:
+    """Limit the threads used by OpenCV, Numba kernels and the FFT.
+
+    Parameters:
+        num_threads (int): The number of threads each library may use.
+    """
+    global _fft_workers
+    cv2.setNumThreads(num_threads)
+    numba.set_num_threads(num_threads)
+    _fft_workers = num_threads
+
+
+def disable_cuda() -> None:
+    """Keep the analysis filters of this process on the CPU.
+
+    `cuda_enabled` then returns False without probing, so no CUDA context is
+    ever created in the process.
+    """
+    global _cuda_allowed
+    _cuda_allowed = False
+
+
+def cuda_enabled() -> bool:
+    """Check whether the analysis filters can run on a GPU.
+
+    Returns:
+        bool: True if CUDA is allowed in this process and available.
+    """
+    return _cuda_allowed and _cuda_available()
+
+
+@lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """Check whether OpenCV has a CUDA device and the bindings the filters use.
+
+    Probed on first use rather than at import, so importing this module does
+    not initialise CUDA in a process that may fork later.
+
+    Returns:
+        bool: True if a CUDA device and the required bindings are available.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0 and all(
+            hasattr(cv2.cuda, name)
+            for name in (
+                "cvtColor",
+                "absdiff",
+                "max",
+                "createLinearFilter",
+                "magnitude",
+                "dft",
+                "log",
+                "createGaussianFilter",
+                "calcHist",
+                "createCannyEdgeDetector",
+            )
+        )
+    except (AttributeError, cv2.error):
+        return False
+
+
+def _jpeg_roundtrip(image: np.ndarray, quality: int) -> np.ndarray:
+    """Compress an image to JPEG in memory and decode it back.
+
+    Parameters:
+        image (np.ndarray): The input BGR image.
+        quality (int): The JPEG quality level.
+
+    Returns:
+        np.ndarray: The decoded image.
+    """
+    _, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return cv2.imdecode(buffer, 1)
+
+
+@njit(cache=True)
+def _get_pixel(image: np.ndarray, r: int, c: int) -> float:
+    """Return a pixel value, or zero outside the image bounds."""
+    if r < 0 or r >= image.shape[0] or c < 0 or c >= image.shape[1]:
+        return 0.0
+    return image[r, c]
+
+
+@njit(parallel=True, cache=True)
+def _lbp_uniform(
+    image: np.ndarray, row_offsets: np.ndarray, col_offsets: np.ndarray
+) -> np.ndarray:
+    """Compute the rotation-invariant uniform LBP of a grayscale image.
+
+    Parameters:
+        image (np.ndarray): The float64 grayscale image.
+        row_offsets (np.ndarray): Row offsets of the sampling points.
+        col_offsets (np.ndarray): Column offsets of the sampling points.
+
+    Returns:
+        np.ndarray: The LBP image.
+    """
+    n_points = row_offsets.shape[0]
+    rows, cols = image.shape
+    output = np.empty((rows, cols), dtype=np.float64)
+
+    for r in prange(rows):
+        for c in range(cols):
+            center = image[r, c]
+            previous = 0
+            changes = 0
+            ones = 0
+            for k in range(n_points):
+                # Bilinear sample, evaluated exactly as scikit-image does.
+                sr = r + row_offsets[k]
+                sc = c + col_offsets[k]
+                minr = int(np.floor(sr))
+                minc = int(np.floor(sc))
+                maxr = int(np.ceil(sr))
+                maxc = int(np.ceil(sc))
+                dr = sr - minr
+                dc = sc - minc
+                top = (1 - dc) * _get_pixel(image, minr, minc) + dc * _get_pixel(
+                    image, minr, maxc
+                )
+                bottom = (1 - dc) * _get_pixel(image, maxr, minc) + dc * _get_pixel(
+                    image, maxr, maxc
+                )
+                bit = 1 if (1 - dr) * top + dr * bottom - center >= 0 else 0
+                if k > 0 and bit != previous:
+                    changes += 1
+                previous = bit
+                ones += bit
+            output[r, c] = ones if changes <= 2 else n_points + 1
+
+    return output
+
+
+def local_binary_pattern_uniform(
+    image: np.ndarray, n_points: int, radius: float
+) -> np.ndarray:
+    """Compute the uniform Local Binary Pattern of a grayscale image.
+
+    Produces the same result as
+    `skimage.feature.local_binary_pattern(..., method="uniform")`.
+
+    Parameters:
+        image (np.ndarray): The grayscale input image.
+        n_points (int): The number of points to sample on the circle.
+        radius (float): The radius of the circle.
+
+    Returns:
+        np.ndarray: The LBP image.
+    """
+    angles = 2 * np.pi * np.arange(n_points, dtype=np.float64) / n_points
+    row_offsets = np.round(-radius * np.sin(angles), 5)
+    col_offsets = np.round(radius * np.cos(angles), 5)
+
+    return _lbp_uniform(
+        np.ascontiguousarray(image, dtype=np.float64), row_offsets, col_offsets
+    )
+
+
+def _cuda_log_half_spectrum(gpu_gray: "cv2.cuda_GpuMat") -> np.ndarray:
+    """Compute the log-magnitude half spectrum of a grayscale image on the GPU.
+
+    Parameters:
+        gpu_gray (cv2.cuda_GpuMat): The grayscale image on the GPU.
+
+    Returns:
+        np.ndarray: The log-magnitude of the `rfft2` half spectrum.
+    """
+    gpu_float = gpu_gray.convertTo(cv2.CV_32F)
+    # A real CV_32FC1 input gives the packed cols // 2 + 1 half spectrum.
+    gpu_spectrum = cv2.cuda.dft(gpu_float, gpu_float.size())
+    return cv2.cuda.log(cv2.cuda.magnitude(gpu_spectrum)).download()
+
+
+def log_magnitude_spectrum(
+    gray_image: np.ndarray, gpu_gray: Optional["cv2.cuda_GpuMat"] = None
+) -> np.ndarray:
+    """Compute the centred log-magnitude Fourier spectrum of a grayscale image.
+
+    Only the half spectrum of the real input is transformed; the other half
+    is restored from its conjugate symmetry, |F(u, v)| = |F(-u, -v)|.
+
+    Parameters:
+        gray_image (np.ndarray): The grayscale input image.
+        gpu_gray (Optional[cv2.cuda_GpuMat]): `gray_image` on the GPU; when
+            given, the transform runs there.
+
+    Returns:
+        np.ndarray: The shifted log-magnitude spectrum, same size as the image.
+    """
+    magnitude = None
+    if gpu_gray is not None:
+        try:
+            magnitude = _cuda_log_half_spectrum(gpu_gray)
+        except cv2.error as e:
+            logging.warning(f"CUDA Fourier transform failed, using the CPU: {e}")
+
+    if magnitude is None:
+        half_spectrum = rfft2(gray_image, workers=_fft_workers)
+        magnitude = np.hypot(half_spectrum.real, half_spectrum.imag)
+        np.log(magnitude, out=magnitude)
+
+    rows, cols = gray_image.shape
+    mirrored = magnitude[-np.arange(rows)][:, (cols - 1) // 2 : 0 : -1]
+    return fftshift(np.concatenate([magnitude, mirrored], axis=1))
+
+
+def haar_chcv(gray_image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the horizontal and vertical Haar detail coefficients.
+
+    Equivalent to the `cH` and `cV` outputs of `pywt.dwt2(gray_image, "haar")`,
+    computed directly on 2x2 blocks without the approximation and diagonal
+    bands.
+
+    Parameters:
+        gray_image (np.ndarray): The grayscale input image.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The horizontal and vertical details.
+    """
+    rows, cols = gray_image.shape
+    # pywt's default symmetric extension repeats the edge for odd sizes.
+    padded = np.pad(
+        gray_image.astype(np.float32, copy=False),
+        ((0, rows % 2), (0, cols % 2)),
+        mode="edge",
+    )
+    blocks = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+    top_left, top_right = blocks[:, 0, :, 0], blocks[:, 0, :, 1]
+    bottom_left, bottom_right = blocks[:, 1, :, 0], blocks[:, 1, :, 1]
+
+    cH = ((top_left + top_right) - (bottom_left + bottom_right)) / 2
+    cV = ((top_left + bottom_left) - (top_right + bottom_right)) / 2
+    return cH, cV
+
+
+def _cuda_ela_composite(
+    image: np.ndarray, gpu_image: "cv2.cuda_GpuMat", quality_levels: List[int]
+) -> np.ndarray:
+    """Fold the JPEG differences of every quality level on the GPU.
+
+    The JPEG round trip stays on the CPU; each decoded image is uploaded and
+    folded into a running maximum of the differences kept on the device.
+
+    Parameters:
+        image (np.ndarray): The input BGR image.
+        gpu_image (cv2.cuda_GpuMat): `image` on the GPU.
+        quality_levels (List[int]): List of JPEG quality levels for ELA.
+
+    Returns:
+        np.ndarray: The per-pixel maximum of the raw differences.
+    """
+    gpu_composite = cv2.cuda_GpuMat(gpu_image.size(), gpu_image.type(), (0, 0, 0, 0))
+    gpu_decoded = cv2.cuda_GpuMat()
+
+    for quality in quality_levels:
+        gpu_decoded.upload(_jpeg_roundtrip(image, quality))
+        gpu_difference = cv2.cuda.absdiff(gpu_image, gpu_decoded)
+        cv2.cuda.max(gpu_composite, gpu_difference, gpu_composite)
+
+    return gpu_composite.download()
+
 
 def perform_ela(
     image: np.ndarray,
     quality_levels: List[int] = [75, 85, 95],
     amplification_factor: int = 20,
+    gpu_image: Optional["cv2.cuda_GpuMat"] = None,
 ) -> np.ndarray:
     """Perform Error Level Analysis on an image.
 
@@ -26,6 +300,8 @@ def perform_ela(
         image (np.ndarray): The input image.
         quality_levels (List[int]): List of JPEG quality levels for ELA.
         amplification_factor (int): Factor by which to amplify the differences.
+        gpu_image (Optional[cv2.cuda_GpuMat]): `image` on the GPU; when given,
+            the differences are folded there.
 
     Returns:
         np.ndarray: The ELA-processed image.
@@ -37,18 +313,27 @@ def perform_ela(
         if not isinstance(image, np.ndarray):
             raise TypeError("Invalid type for image. Expected np.ndarray.")
 
-        ela_images = []
-        original_shape = image.shape
-
-        for quality in quality_levels:
-            _, compressed_image = cv2.imencode(
-                ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality]
-            )
-            compressed_image = cv2.imdecode(compressed_image, 1)
-            ela_image = cv2.absdiff(image, compressed_image) * amplification_factor
-            ela_images.append(ela_image)
-
-        composite_ela = np.maximum.reduce(ela_images)
+        # Fold each quality level into a single running maximum of the raw
+        # differences, then amplify once with saturation.
+        composite_ela = None
+        if gpu_image is not None:
+            try:
+                composite_ela = _cuda_ela_composite(image, gpu_image, quality_levels)
+            except cv2.error as e:
+                logging.warning(f"CUDA ELA failed, using the CPU: {e}")
+
+        if composite_ela is None:
+            composite_ela = np.zeros_like(image)
+            for quality in quality_levels:
+                # The decoded image is scratch space: overwrite it with the
+                # difference, then fold it into the composite in place.
+                difference = _jpeg_roundtrip(image, quality)
+                cv2.absdiff(image, difference, dst=difference)
+                cv2.max(composite_ela, difference, dst=composite_ela)
+
+        cv2.convertScaleAbs(
+            composite_ela, dst=composite_ela, alpha=amplification_factor
+        )
         composite_ela = cv2.applyColorMap(composite_ela, cv2.COLORMAP_JET)
         return composite_ela
 
@@ -57,8 +342,82 @@ def perform_ela(
         return None
 
 
+@lru_cache(maxsize=32)
+def _gabor_kernels(
+    frequency: float, theta: float, bandwidth: float, n_stds: int = 3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the real and imaginary Gabor kernels used by `skimage.filters.gabor`.
+
+    The kernel size and isotropic sigma follow `skimage.filters.gabor_kernel`.
+    OpenCV stores the kernel point-reflected, so correlating with it in
+    `cv2.filter2D` gives the convolution computed by scikit-image.
+    Kernels are cached per parameter set and returned read-only.
+
+    Parameters:
+        frequency (float): The frequency of the harmonic function.
+        theta (float): Orientation in radians.
+        bandwidth (float): The bandwidth of the filter.
+        n_stds (int): Kernel half-size in standard deviations.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The real and imaginary kernels.
+    """
+    sigma = (
+        np.sqrt(np.log(2) / 2)
+        / np.pi
+        * (2.0**bandwidth + 1)
+        / (2.0**bandwidth - 1)
+        / frequency
+    )
+    # sigma_x == sigma_y, so the kernel is square.
+    extent = n_stds * sigma * max(abs(np.cos(theta)), abs(np.sin(theta)))
+    half_size = int(np.ceil(max(extent, 1)))
+    ksize = (2 * half_size + 1, 2 * half_size + 1)
+
+    kernel_real = cv2.getGaborKernel(
+        ksize, sigma, theta, 1 / frequency, 1, 0, ktype=cv2.CV_32F
+    )
+    kernel_imag = cv2.getGaborKernel(
+        ksize, sigma, theta, 1 / frequency, 1, -np.pi / 2, ktype=cv2.CV_32F
+    )
+    # The kernels are cached and shared between calls.
+    kernel_real.flags.writeable = False
+    kernel_imag.flags.writeable = False
+    return kernel_real, kernel_imag
+
+
+def _cuda_gabor_magnitude(
+    gpu_gray: "cv2.cuda_GpuMat", kernel_real: np.ndarray, kernel_imag: np.ndarray
+) -> np.ndarray:
+    """Compute the Gabor response magnitude of a grayscale image on the GPU.
+
+    Parameters:
+        gpu_gray (cv2.cuda_GpuMat): The grayscale image on the GPU.
+        kernel_real (np.ndarray): The real Gabor kernel.
+        kernel_imag (np.ndarray): The imaginary Gabor kernel.
+
+    Returns:
+        np.ndarray: The float32 magnitude of the complex response.
+    """
+    gpu_float = gpu_gray.convertTo(cv2.CV_32F)
+    real_filter = cv2.cuda.createLinearFilter(
+        cv2.CV_32FC1, cv2.CV_32FC1, kernel_real, borderMode=cv2.BORDER_REFLECT
+    )
+    imag_filter = cv2.cuda.createLinearFilter(
+        cv2.CV_32FC1, cv2.CV_32FC1, kernel_imag, borderMode=cv2.BORDER_REFLECT
+    )
+    return cv2.cuda.magnitude(
+        real_filter.apply(gpu_float), imag_filter.apply(gpu_float)
+    ).download()
+
+
 def perform_gabor_filtering(
-    image: np.ndarray, frequency: float = 0.6, theta: float = 0, bandwidth: float = 1.0
+    image: np.ndarray,
+    frequency: float = 0.6,
+    theta: float = 0,
+    bandwidth: float = 1.0,
+    gray_image: Optional[np.ndarray] = None,
+    gpu_gray: Optional["cv2.cuda_GpuMat"] = None,
 ) -> np.ndarray:
     """Perform Gabor filtering on an image.
 
@@ -67,6 +426,9 @@ def perform_gabor_filtering(
         frequency (float): The frequency of the Gabor filter.
         theta (float): Orientation in radians.
         bandwidth (float): The bandwidth of the Gabor filter.
+        gray_image (Optional[np.ndarray]): Precomputed grayscale of `image`.
+        gpu_gray (Optional[cv2.cuda_GpuMat]): The grayscale image on the GPU;
+            when given, kernels up to 32x32 are applied there.
 
     Returns:
         np.ndarray: The Gabor-filtered image.
@@ -75,22 +437,28 @@ def perform_gabor_filtering(
         logging.warning("Received a NoneType image for Gabor filtering.")
         return None
 
-    gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    gabor_real, gabor_imag = gabor(
-        gray_image, frequency=frequency, theta=theta, bandwidth=bandwidth
-    )
-
-    if gabor_real is None or gabor_imag is None:
-        logging.error("Gabor function returned None.")
-        return None
-
-    if gabor_real.size == 0 or gabor_imag.size == 0:
-        logging.error("Gabor function returned an empty array.")
-        return None
-
-    gabor_image = np.sqrt(gabor_real**2 + gabor_imag**2).astype(np.float32)
+    kernel_real, kernel_imag = _gabor_kernels(frequency, theta, bandwidth)
+
+    gabor_image = None
+    if gpu_gray is not None and kernel_real.shape[0] <= _CUDA_MAX_KERNEL_SIZE:
+        try:
+            gabor_image = _cuda_gabor_magnitude(gpu_gray, kernel_real, kernel_imag)
+        except cv2.error as e:
+            logging.warning(f"CUDA Gabor filtering failed, using the CPU: {e}")
+
+    if gabor_image is None:
+        if gray_image is None:
+            gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray_image = gray_image.astype(np.float32, copy=False)
+        gabor_real = cv2.filter2D(
+            gray_image, cv2.CV_32F, kernel_real, borderType=cv2.BORDER_REFLECT
+        )
+        gabor_imag = cv2.filter2D(
+            gray_image, cv2.CV_32F, kernel_imag, borderType=cv2.BORDER_REFLECT
+        )
+        gabor_image = cv2.magnitude(gabor_real, gabor_imag)
 
-    min_val, max_val = np.min(gabor_image), np.max(gabor_image)
+    min_val, max_val, _, _ = cv2.minMaxLoc(gabor_image)
 
     if min_val != max_val:
         gabor_image = cv2.normalize(
@@ -106,7 +474,11 @@ def perform_gabor_filtering(
 
 
 def perform_frequency_analysis(
-    image: np.ndarray, wavelet_type: str = "haar", fourier_weight: float = 0.5
+    image: np.ndarray,
+    wavelet_type: str = "haar",
+    fourier_weight: float = 0.5,
+    gray_image: Optional[np.ndarray] = None,
+    gpu_gray: Optional["cv2.cuda_GpuMat"] = None,
 ) -> np.ndarray:
     """
     Perform frequency analysis on an image using Fourier and Wavelet Transforms.
@@ -115,6 +487,8 @@ def perform_frequency_analysis(
         image (np.ndarray): The input image.
         wavelet_type (str): The type of wavelet to use for DWT. Default is "haar".
         fourier_weight (float): The weight for Fourier spectrum while combining. Default is 0.5.
+        gray_image (Optional[np.ndarray]): Precomputed grayscale of `image`. Default is None.
+        gpu_gray (Optional[cv2.cuda_GpuMat]): The grayscale image on the GPU, for the Fourier transform. Default is None.
 
     Returns:
         np.ndarray: The frequency-analyzed image.
@@ -123,13 +497,16 @@ def perform_frequency_analysis(
         if image is None:
             raise ValueError("Received a NoneType image for frequency analysis.")
 
-        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        f_transform = fftshift(fft2(gray_image))
-        magnitude_spectrum = np.log(np.abs(f_transform))
+        if gray_image is None:
+            gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray_image = gray_image.astype(np.float32, copy=False)
+        magnitude_spectrum = log_magnitude_spectrum(gray_image, gpu_gray)
 
-        coeffs = pywt.dwt2(gray_image, wavelet_type)
-        cA, (cH, cV, cD) = coeffs
-        wavelet_magnitude = np.sqrt(cH**2 + cV**2)
+        if wavelet_type in ("haar", "db1"):
+            cH, cV = haar_chcv(gray_image)
+        else:
+            _, (cH, cV, _) = pywt.dwt2(gray_image, wavelet_type)
+        wavelet_magnitude = np.hypot(cH, cV)
 
         wavelet_magnitude_resized = cv2.resize(
             wavelet_magnitude,
@@ -155,6 +532,7 @@ def perform_texture_analysis(
     radius: int = 3,
     n_points: int = 24,
     method: str = "uniform",
+    gray_image: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Perform texture analysis on an image using Local Binary Pattern.
 
@@ -163,6 +541,7 @@ def perform_texture_analysis(
         radius (int): The radius of the circle for LBP. Default is 3.
         n_points (int): The number of points to sample on the circle. Default is 24.
         method (str): The method to calculate the LBP. Default is "uniform".
+        gray_image (Optional[np.ndarray]): Precomputed grayscale of `image`. Default is None.
 
     Returns:
         np.ndarray: The texture-analyzed image.
@@ -177,8 +556,14 @@ def perform_texture_analysis(
         if not (0 < n_points < 100):
             raise ValueError("Invalid number of points.")
 
-        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        lbp_image = local_binary_pattern(gray_image, n_points, radius, method=method)
+        if gray_image is None:
+            gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if method == "uniform":
+            lbp_image = local_binary_pattern_uniform(gray_image, n_points, radius)
+        else:
+            lbp_image = local_binary_pattern(
+                gray_image, n_points, radius, method=method
+            )
         lbp_image = normalize_gray_image(lbp_image)
         return lbp_image
 
@@ -187,19 +572,87 @@ def perform_texture_analysis(
         return None
 
 
+def _otsu_threshold(hist: np.ndarray) -> float:
+    """Compute Otsu's threshold from the 256-bin histogram of a uint8 image.
+
+    Parameters:
+        hist (np.ndarray): The 256-bin intensity histogram.
+
+    Returns:
+        float: The threshold maximising the between-class variance, as
+        returned by `cv2.threshold(..., cv2.THRESH_OTSU)`.
+    """
+    hist = np.asarray(hist).ravel()
+    probabilities = hist.astype(np.float64) / hist.sum()
+    levels = np.arange(256, dtype=np.float64)
+
+    q1 = np.cumsum(probabilities)
+    q2 = 1 - q1
+    first_moment = np.cumsum(levels * probabilities)
+    mean = first_moment[-1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu1 = first_moment / q1
+        mu2 = (mean - first_moment) / q2
+        between_variance = q1 * q2 * (mu1 - mu2) ** 2
+
+    eps = np.finfo(np.float32).eps
+    valid = (np.minimum(q1, q2) >= eps) & (np.maximum(q1, q2) <= 1 - eps)
+    if not valid.any():
+        return 0.0
+    return float(np.argmax(np.where(valid, between_variance, -1)))
+
+
+def _cuda_edge_detection(
+    gpu_gray: "cv2.cuda_GpuMat",
+    kernel_size: tuple,
+    lower_multiplier: float,
+    upper_multiplier: float,
+) -> np.ndarray:
+    """Run the blur, threshold and Canny stages of edge detection on the GPU.
+
+    Only the 256-bin histogram and the final edge map are downloaded.
+
+    Parameters:
+        gpu_gray (cv2.cuda_GpuMat): The grayscale image on the GPU.
+        kernel_size (tuple): The kernel size for Gaussian blurring.
+        lower_multiplier (float): Multiplier for the lower Canny threshold.
+        upper_multiplier (float): Multiplier for the upper Canny threshold.
+
+    Returns:
+        np.ndarray: The edge-detected grayscale image.
+    """
+    gaussian = cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, kernel_size, 0)
+    gpu_blurred = gaussian.apply(gpu_gray)
+
+    otsu_val = _otsu_threshold(cv2.cuda.calcHist(gpu_blurred).download())
+    lower = int(max(0, lower_multiplier * otsu_val))
+    upper = int(min(255, upper_multiplier * otsu_val))
+
+    canny = cv2.cuda.createCannyEdgeDetector(lower, upper)
+    return canny.detect(gpu_blurred).download()
+
+
 def perform_advanced_edge_detection(
     image: np.ndarray,
     kernel_size: tuple = (5, 5),
     lower_multiplier: float = 0.7,
     upper_multiplier: float = 1.3,
+    gray_image: Optional[np.ndarray] = None,
+    gpu_gray: Optional["cv2.cuda_GpuMat"] = None,
 ) -> np.ndarray:
     """Perform advanced edge detection on an image.
 
+    The Canny thresholds are the multipliers applied to Otsu's threshold of
+    the blurred grayscale image.
+
     Parameters:
         image (np.ndarray): The input color image.
         kernel_size (tuple): The kernel size for Gaussian blurring. Defaults to (5, 5).
         lower_multiplier (float): Multiplier for the lower Canny threshold. Defaults to 0.7.
         upper_multiplier (float): Multiplier for the upper Canny threshold. Defaults to 1.3.
+        gray_image (Optional[np.ndarray]): Precomputed grayscale of `image`. Defaults to None.
+        gpu_gray (Optional[cv2.cuda_GpuMat]): The grayscale image on the GPU; when given, detection runs there. Defaults to None.
 
     Returns:
         np.ndarray: The edge-detected grayscale image, or None if an error occurs.
@@ -212,11 +665,21 @@ def perform_advanced_edge_detection(
         if not (0 < lower_multiplier < upper_multiplier < 10):
             raise ValueError("Invalid threshold multipliers.")
 
-        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if gpu_gray is not None:
+            try:
+                return _cuda_edge_detection(
+                    gpu_gray, kernel_size, lower_multiplier, upper_multiplier
+                )
+            except cv2.error as e:
+                logging.warning(f"CUDA edge detection failed, using the CPU: {e}")
+
+        if gray_image is None:
+            gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         blurred_image = cv2.GaussianBlur(gray_image, kernel_size, 0)
-        median_val = np.median(blurred_image)
-        lower = int(max(0, lower_multiplier * median_val))
-        upper = int(min(255, upper_multiplier * median_val))
+        hist = cv2.calcHist([blurred_image], [0], None, [256], [0, 256])
+        otsu_val = _otsu_threshold(hist)
+        lower = int(max(0, lower_multiplier * otsu_val))
+        upper = int(min(255, upper_multiplier * otsu_val))
         edge_image = cv2.Canny(blurred_image, lower, upper)
 
         return edge_image
@@ -28,39 +28,54 @@ def annotate_image(image: np.ndarray, text: str, spec: str = "") -> None:
         cv2.putText(image, spec, (10, h - 5), font, 0.4, (255, 255, 0), 1, cv2.LINE_AA)
 
 
-def standardize_dimensions(images: List[np.ndarray]) -> List[np.ndarray]:
+def compose_report(
+    images: List[np.ndarray],
+    annotations: List[str],
+    specs: List[str],
+    columns: int = 3,
+) -> np.ndarray:
     """
-    Standardize the dimensions of a list of images.
-    :param images: The list of images to standardize.
-    :return: List of standardized images.
+    Build the annotated report mosaic in a single pass over the images.
+    Each image is resized to the size of the first one, converted to color and
+    annotated directly inside its tile of the preallocated mosaic.
+    :param images: The list of images to compose; the first sets the tile size.
+    :param annotations: The annotation text for each image.
+    :param specs: The algorithmic specifications for each image.
+    :param columns: The number of images per row.
+    :return: The report mosaic.
     """
-    if not images:
-        logging.warning("Received an empty list for standardization.")
-        return []
+    if not images or images[0] is None:
+        logging.warning("Received an empty list for the report.")
+        return None
 
     h, w = images[0].shape[:2]
-    return [cv2.resize(img, (w, h)) for img in images]
+    rows = -(-len(images) // columns)
+    mosaic = np.zeros((rows * h, columns * w, 3), dtype=np.uint8)
 
+    for idx, img in enumerate(images):
+        r, c = divmod(idx, columns)
+        tile = mosaic[r * h : (r + 1) * h, c * w : (c + 1) * w]
 
-def convert_to_color(images: List[np.ndarray]) -> List[np.ndarray]:
-    """
-    Convert grayscale images to color images.
-    :param images: The list of images to convert.
-    :return: List of color images.
-    """
-    color_images = []
-    for img in images:
         if img is None:
             logging.warning(
-                "Encountered a NoneType image during color conversion. Skipping."
+                "Encountered a NoneType image while composing the report. "
+                "Leaving its tile blank."
             )
             continue
 
         if len(img.shape) == 2:
-            color_images.append(cv2.cvtColor(img, cv2.COLOR_GRAY2BGR))
+            # Resize while still single-channel, then expand into the tile.
+            if img.shape[:2] != (h, w):
+                img = cv2.resize(img, (w, h))
+            cv2.cvtColor(img, cv2.COLOR_GRAY2BGR, dst=tile)
+        elif img.shape[:2] != (h, w):
+            cv2.resize(img, (w, h), dst=tile)
         else:
-            color_images.append(img)
-    return color_images
+            tile[:] = img
+
+        annotate_image(tile, annotations[idx], specs[idx])
+
+    return mosaic
 
 
 def normalize_gray_image(image: np.ndarray) -> np.ndarray: